@@ -33,18 +33,16 @@ namespace PHARMACY_1.Administrator_UC
 
         private void UCDASHBOARD_Load(object sender, EventArgs e)
         {
-            query = "select count(userRole) from users where userRole ='Administrator'";
+            query = "select count(case when userRole ='Administrator' then userRole end), count(case when userRole ='Pharmacist' then userRole end) from users";
             ds = fn.getdata(query);
-            setLabel(ds, Adminlabel);
-            query = "select count(userRole) from users where userRole ='Pharmacist'";
-            ds = fn.getdata(query);
-            setLabel(ds, Pharlabel);
+            setLabel(ds, 0, Adminlabel);
+            setLabel(ds, 1, Pharlabel);
         }
-        private void setLabel(DataSet ds,Label lbl) 
+        private void setLabel(DataSet ds,int column,Label lbl) 
         {
             if (ds.Tables[0].Rows.Count != 0)
             {
-                lbl.Text = ds.Tables[0].Rows[0][0].ToString();
+                lbl.Text = ds.Tables[0].Rows[0][column].ToString();
             }
             else
             {
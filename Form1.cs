@@ -51,7 +51,7 @@ namespace PHARMACY_1
            /* Administrator admin = new Administrator();
             admin.Show();
             this.Hide();*/
-            query = "select * from users";
+            query = "select top 1 username from users";
              ds = fn.getdata(query);
              if (ds.Tables[0].Rows.Count == 0)
              {
@@ -28,14 +28,12 @@ namespace PHARMACY_1.PharmacistUC
         }
         public void loadChart()
         {
-            query = "select count (mname) from medic where eDate >= getdate()";
+            query = "select count (case when eDate >= getdate() then mname end), count (case when eDate <= getdate() then mname end) from medic";
             ds=fn.getdata(query);
             count =Int64.Parse( ds.Tables[0].Rows[0][0].ToString());
             this.chart1.Series["Valid Medicines"].Points.AddXY("Medicine Validity Chart",count);
 
-            query = "select count (mname) from medic where eDate <= getdate()";
-            ds = fn.getdata(query);
-            count = Int64.Parse(ds.Tables[0].Rows[0][0].ToString());
+            count = Int64.Parse(ds.Tables[0].Rows[0][1].ToString());
             this.chart1.Series["Expired Medicines"].Points.AddXY("Medicine Validity Chart", count);
         }
 
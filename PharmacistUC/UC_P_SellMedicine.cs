@@ -24,14 +24,15 @@ namespace PHARMACY_1.PharmacistUC
 
         private void UC_P_SellMedicine_Load(object sender, EventArgs e)
         {
-            listBoxMedicines.Items.Clear();
             query = "select mname from medic where eDate >= getdate() and quantity > 0";
             ds=fn.getdata(query);
+            setMedicineList(ds);
+        }
 
-            for(int i = 0; i < ds.Tables[0].Rows.Count;i++) 
-            {
-                listBoxMedicines.Items.Add(ds.Tables[0].Rows[i][0].ToString());
-            }
+        private void setMedicineList(DataSet ds)
+        {
+            listBoxMedicines.Items.Clear();
+            listBoxMedicines.Items.AddRange(ds.Tables[0].Rows.Cast<DataRow>().Select(row => (object)row[0].ToString()).ToArray());
         }
 
         private void btnsync_Click(object sender, EventArgs e)
@@ -41,13 +42,9 @@ namespace PHARMACY_1.PharmacistUC
 
         private void txtSearchBox_TextChanged(object sender, EventArgs e)
         {
-            listBoxMedicines.Items.Clear();
             query = "select mname from medic where mname like '" + txtSearchBox.Text + "%' and eDate >= getdate() and quantity > 0";
             ds = fn.getdata(query);
-            for(int i = 0; i < ds.Tables[0].Rows.Count; i++)
-            {
-                listBoxMedicines.Items.Add(ds.Tables[0].Rows[i][0].ToString());
-            }
+            setMedicineList(ds);
         }
 
         private void listBoxMedicines_SelectedIndexChanged(object sender, EventArgs e)
@@ -12,12 +12,18 @@ namespace PHARMACY_1
 {
     internal class function
     {
+        private static string connectionString;
+
         protected SqlConnection getConnection()
         {
-            string connectionString = ConfigurationManager.ConnectionStrings["PharmacyDb"]?.ConnectionString;
-            if (string.IsNullOrWhiteSpace(connectionString))
+            if (connectionString == null)
             {
-                throw new InvalidOperationException("Missing connection string 'PharmacyDb' in App.config.");
+                string configured = ConfigurationManager.ConnectionStrings["PharmacyDb"]?.ConnectionString;
+                if (string.IsNullOrWhiteSpace(configured))
+                {
+                    throw new InvalidOperationException("Missing connection string 'PharmacyDb' in App.config.");
+                }
+                connectionString = configured;
             }
             SqlConnection con = new SqlConnection(connectionString);
             return con;    